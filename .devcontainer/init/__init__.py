@@ -14,10 +14,10 @@ Commands:
 """
 import os
 import sys
-import atexit
 import platform
 import importlib
 import compileall
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -42,17 +42,21 @@ from .orchestration.github_provisioner import main as github_provision
 
 logger = get_logger()
 
-# Register shutdown hook to ensure resources are cleaned up
-atexit.register(shutdown_executors)
-
-# Compile package to bytecode at import time for better performance
 _package_dir = Path(__file__).parent
-compileall.compile_dir(
-    str(_package_dir),
-    force=True,
-    quiet=1,
-    optimize=2
-)
+
+def _precompile_package() -> None:
+    """Compile the package to bytecode ahead of the main workload.
+
+    Runs from main() rather than at import time: forcing a full
+    recompile on every 'import init' penalized library consumers for
+    work only the entry point benefits from.
+    """
+    compileall.compile_dir(
+        str(_package_dir),
+        force=True,
+        quiet=1,
+        optimize=2
+    )
 
 __version__ = '1.0.0'
 __author__ = 'DeanLuus1994'
@@ -118,7 +122,9 @@ def main() -> int:
         # Print basic system info
         logger.info(f"Python {platform.python_version()} on {platform.system()}")
         logger.info(f"Core v{core_version}, Functions v{functions_version}")
-        
+
+        _precompile_package()
+
         # Initialize environment
         vars_loaded = init_environment()
         if vars_loaded == 0:
@@ -133,11 +139,15 @@ def main() -> int:
             return github_provision()
         elif command == 'all':
             logger.info("Running all initialization tasks")
-            optimizer = PythonOptimizer()
-            python_result = optimizer.run()
-            if python_result != 0:
-                return python_result
-            return github_provision()
+            # Python optimization (CPU/local disk) and repository
+            # provisioning (network) touch disjoint state, so they can
+            # overlap instead of running back to back
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                python_future = pool.submit(lambda: PythonOptimizer().run())
+                github_future = pool.submit(github_provision)
+                python_result = python_future.result()
+                github_result = github_future.result()
+            return python_result or github_result
         elif command in ['-h', '--help', 'help']:
             show_help()
             return 0
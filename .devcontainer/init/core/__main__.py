@@ -10,23 +10,39 @@ import importlib
 import inspect
 import pkgutil
 import compileall
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 
+# Resolved once; several checks below need the package directory
+_PACKAGE_DIR = Path(__file__).parent
+
+# Packages shown in the dependency report, frozen with their normalized
+# metadata keys precomputed instead of re-derived per run
+_REPORTED_PACKAGES = tuple(
+    (pkg, pkg.lower().replace("-", "_"))
+    for pkg in ("pyyaml", "typing_extensions")
+)
+
+@lru_cache(maxsize=1)
+def _package_modules() -> Tuple[str, ...]:
+    """Names of this package's submodules, scanned from disk once.
+
+    The actual module objects are cached in sys.modules by
+    importlib.import_module; this caches the directory scan that every
+    quality check repeated.
+    """
+    return tuple(
+        name for _, name, _ in pkgutil.iter_modules([str(_PACKAGE_DIR)])
+        if not name.startswith('__')
+    )
+
 def check_type_annotations() -> Tuple[int, List[str]]:
     """Check for proper type annotations in all module functions."""
-    import inspect
-    from . import __all__ as exposed_items
-    
-    module_names = [
-        name for _, name, _ in pkgutil.iter_modules([str(Path(__file__).parent)])
-        if not name.startswith('__')
-    ]
-    
     missing = []
     total_functions = 0
-    
-    for module_name in module_names:
+
+    for module_name in _package_modules():
         module = importlib.import_module(f".{module_name}", package=__package__)
         for name, obj in inspect.getmembers(module):
             if inspect.isfunction(obj) and not name.startswith('_'):
@@ -48,15 +64,10 @@ def check_type_annotations() -> Tuple[int, List[str]]:
 
 def check_docstrings() -> Tuple[int, List[str]]:
     """Check for docstrings in all module functions."""
-    module_names = [
-        name for _, name, _ in pkgutil.iter_modules([str(Path(__file__).parent)])
-        if not name.startswith('__')
-    ]
-    
     missing = []
     total_functions = 0
-    
-    for module_name in module_names:
+
+    for module_name in _package_modules():
         module = importlib.import_module(f".{module_name}", package=__package__)
         for name, obj in inspect.getmembers(module):
             if inspect.isfunction(obj) and not name.startswith('_'):
@@ -71,15 +82,10 @@ def check_imports() -> List[str]:
     try:
         import pyflakes.api
         import pyflakes.reporter
-        
-        module_names = [
-            name for _, name, _ in pkgutil.iter_modules([str(Path(__file__).parent)])
-            if not name.startswith('__')
-        ]
-        
+
         issues = []
-        for module_name in module_names:
-            module_path = Path(__file__).parent / f"{module_name}.py"
+        for module_name in _package_modules():
+            module_path = _PACKAGE_DIR / f"{module_name}.py"
             if module_path.exists():
                 reporter = pyflakes.reporter.Reporter(issues.append, issues.append)
                 pyflakes.api.checkPath(str(module_path), reporter)
@@ -92,7 +98,7 @@ def precompile_bytecode() -> bool:
     """Compile all Python files in this package to bytecode."""
     print(f"Compiling {__package__} modules to bytecode...")
     success = compileall.compile_dir(
-        str(Path(__file__).parent),
+        str(_PACKAGE_DIR),
         force=True,
         quiet=0,
         legacy=False,
@@ -125,16 +131,17 @@ def run_quality_checks() -> None:
     else:
         print(f"✓ All {total_funcs} functions have docstrings\n")
     
-    try:
-        from importlib.metadata import version
-        print("\nPackage Dependencies:")
-        for pkg in ["pyyaml", "typing_extensions"]:
-            try:
-                print(f"  - {pkg}: {version(pkg)}")
-            except:
-                print(f"  - {pkg}: not installed")
-    except:
-        pass
+    from importlib.metadata import distributions
+    # One scan over the installed distributions answers every lookup;
+    # calling version() per package would re-walk site-packages each time
+    installed = {
+        (dist.metadata["Name"] or "").lower().replace("-", "_"): dist.version
+        for dist in distributions()
+    }
+    print("\nPackage Dependencies:")
+    for pkg, lookup_key in _REPORTED_PACKAGES:
+        pkg_version = installed.get(lookup_key)
+        print(f"  - {pkg}: {pkg_version or 'not installed'}")
     
     print(f"\n{'-'*70}")
     print("RECOMMENDATIONS FOR IMPROVEMENT:")
@@ -1,36 +1,63 @@
 """Environment variable handling utilities."""
 
 import os
+import mmap
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from ...log.logger import get_logger
 from ..utils.validation import validate_path, validate_dict_key
 
 logger = get_logger()
 
+# Files at or above this size are scanned via mmap instead of buffered reads
+_MMAP_THRESHOLD = 1 << 20
+
+def _parse_env_lines(lines: Iterable[str]) -> Dict[str, str]:
+    """Parse KEY=value lines into a dictionary.
+
+    Args:
+        lines: Iterable of raw lines
+
+    Returns:
+        Dictionary of environment variables
+    """
+    env_vars = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        # partition never raises, so malformed lines (no '=')
+        # are skipped without exception-handling overhead
+        key, sep, value = line.partition('=')
+        if sep:
+            env_vars[key.strip()] = value.strip()
+    return env_vars
+
 def load_env_file(env_path: Path) -> Dict[str, str]:
     """Load environment variables from a file.
-    
+
     Args:
         env_path: Path to the .env file
-        
+
     Returns:
         Dictionary of environment variables
     """
     env_vars = {}
     try:
         env_path = validate_path(env_path, must_exist=True)
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                try:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-                except ValueError:
-                    continue
+        if env_path.stat().st_size >= _MMAP_THRESHOLD:
+            # Large files: let the kernel page the file in and scan the
+            # mapped bytes directly rather than copying through a buffer
+            with open(env_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    env_vars = _parse_env_lines(
+                        raw.decode('utf-8', 'replace')
+                        for raw in iter(mm.readline, b'')
+                    )
+        else:
+            with open(env_path, 'r') as f:
+                env_vars = _parse_env_lines(f)
     except FileNotFoundError:
         logger.warning(f"Environment file not found: {env_path}")
     except Exception as e:
@@ -76,16 +103,22 @@ def update_env_initialized_flag(env_path: Path, initialized: bool = True) -> boo
     """
     try:
         if env_path.exists():
+            desired = f'INITIALIZED={"true" if initialized else "false"}\n'
             content = []
+            needs_write = False
             with open(env_path, 'r') as f:
                 for line in f:
-                    if line.startswith('INITIALIZED='):
-                        content.append(f'INITIALIZED={"true" if initialized else "false"}\n')
+                    if line.startswith('INITIALIZED=') and line != desired:
+                        content.append(desired)
+                        needs_write = True
                     else:
                         content.append(line)
-            
-            with open(env_path, 'w') as f:
-                f.writelines(content)
+
+            # Short-circuit when the flag already holds the desired value;
+            # the warm-start path then never rewrites the file
+            if needs_write:
+                with open(env_path, 'w') as f:
+                    f.writelines(content)
             return True
         return False
     except Exception as e:
@@ -107,17 +140,20 @@ def set_env_from_config(config: Dict[str, Any], prefix: str = "") -> int:
         
     count = 0
     try:
-        def _flatten_dict(d: Dict[str, Any], parent_key: str = "") -> Dict[str, Any]:
-            items = []
+        # Flatten iteratively with an explicit stack: no per-level dict
+        # allocations or recursion, and deeply nested configs cannot hit
+        # the recursion limit
+        flattened = {}
+        stack = [("", config)]
+        while stack:
+            parent_key, d = stack.pop()
             for k, v in d.items():
                 new_key = f"{parent_key}_{k}" if parent_key else k
                 if isinstance(v, dict):
-                    items.extend(_flatten_dict(v, new_key).items())
+                    stack.append((new_key, v))
                 else:
-                    items.append((new_key, v))
-            return dict(items)
-            
-        flattened = _flatten_dict(config)
+                    flattened[new_key] = v
+
         for key, value in flattened.items():
             env_key = f"{prefix}_{key}".upper() if prefix else key.upper()
             if isinstance(value, (list, tuple)):
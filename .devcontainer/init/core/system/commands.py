@@ -23,10 +23,11 @@ def has_command(cmd: str) -> bool:
         if cmd in _cmd_cache:
             return _cmd_cache[cmd]
         
+        # os.access already reports False for missing files, so the
+        # os.path.exists pre-check only doubled the stat traffic
         result = any(
             os.access(os.path.join(path, cmd), os.X_OK)
             for path in os.environ["PATH"].split(os.pathsep)
-            if os.path.exists(os.path.join(path, cmd))
         )
         
         _cmd_cache[cmd] = result
@@ -53,14 +54,16 @@ def run_command(args: List[str], check: bool = True,
         
     cmd_str = " ".join(args)
     try:
+        # close_fds=False lets subprocess use posix_spawn on Linux,
+        # avoiding the fork+close-range overhead per spawned git/tool
         if capture:
             result = subprocess.run(
-                args, check=check, stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, text=True
+                args, check=check, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, text=True, close_fds=False
             )
             return result.stdout.strip()
         else:
-            subprocess.run(args, check=check)
+            subprocess.run(args, check=check, close_fds=False)
             return None
     except subprocess.CalledProcessError as e:
         logger.error(f"Command failed: {cmd_str}")
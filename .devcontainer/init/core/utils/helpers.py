@@ -128,12 +128,20 @@ def dict_deep_merge(base: Dict[str, Any],
         New merged dictionary
     """
     result = base.copy()
-    
-    for key, value in override.items():
-        if (key in result and isinstance(result[key], dict) 
-                and isinstance(value, dict)):
-            result[key] = dict_deep_merge(result[key], value)
-        else:
-            result[key] = value
-            
+
+    # Iterative merge with an explicit stack: one frame for the whole
+    # traversal instead of one per nesting level, and arbitrarily deep
+    # configs cannot hit the recursion limit
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if (key in dst and isinstance(dst[key], dict)
+                    and isinstance(value, dict)):
+                merged = dst[key].copy()
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
+
     return result
\ No newline at end of file
@@ -22,8 +22,7 @@ def validate_dict_key(d: Dict[str, Any], key: str,
     return d.get(key, default)
 def validate_executable(cmd: str) -> bool:
     return any(os.access(os.path.join(p, cmd), os.X_OK)
-              for p in os.environ["PATH"].split(os.pathsep)
-              if os.path.exists(os.path.join(p, cmd)))
+              for p in os.environ["PATH"].split(os.pathsep))
 def ensure_list(value: Any) -> List[Any]:
     if value is None:
         return []
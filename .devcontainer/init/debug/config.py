@@ -3,9 +3,26 @@
 import os
 import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
 
+@lru_cache(maxsize=8)
+def _load_yaml_config(config_path: str, mtime: float) -> Dict[str, Any]:
+    """Load and parse a YAML config file, cached by path and mtime.
+
+    Args:
+        config_path: Path to YAML configuration file
+        mtime: File modification time, part of the cache key so edits
+            invalidate the cached parse
+
+    Returns:
+        Parsed configuration dictionary (empty if not a mapping)
+    """
+    with open(config_path, 'r') as f:
+        yaml_config = yaml.safe_load(f)
+    return yaml_config if isinstance(yaml_config, dict) else {}
+
 class DebugConfig:
     """Debug configuration management.
     
@@ -59,14 +76,15 @@ class DebugConfig:
             config_path: Path to YAML configuration file
         """
         try:
-            with open(config_path, 'r') as f:
-                yaml_config = yaml.safe_load(f)
-                
-            if yaml_config and isinstance(yaml_config, dict):
+            yaml_config = _load_yaml_config(
+                config_path, os.stat(config_path).st_mtime
+            )
+
+            if yaml_config:
                 if 'debug' in yaml_config:
                     # Use debug section if available
                     yaml_config = yaml_config['debug']
-                    
+
                 # Update configuration
                 self._config.update(yaml_config)
         except Exception as e:
@@ -1,6 +1,7 @@
 """Executor utilities for parallel processing."""
 
 import os
+import atexit
 import threading
 import concurrent.futures
 from typing import List, Callable, TypeVar, Dict, Any, Iterable, Optional, Tuple, Union
@@ -193,4 +194,8 @@ def shutdown_executors() -> None:
                 executor.shutdown(wait=False)
             except Exception as e:
                 logger.warning(f"Error shutting down executor '{name}': {e}")
-        _executors.clear()
\ No newline at end of file
+        _executors.clear()
+
+# Register the shutdown hook exactly once, where the executors live.
+# Registering in each consumer module stacked duplicate atexit entries.
+atexit.register(shutdown_executors)
\ No newline at end of file
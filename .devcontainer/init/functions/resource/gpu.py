@@ -1,17 +1,22 @@
 """GPU detection and setup utilities."""
 
 import os
+import re
 import platform
+import subprocess
 from typing import Dict, Any
 from ...log.logger import get_logger
 from ...core.system.commands import has_command, run_command
 
 logger = get_logger()
 
-def detect_gpu(resources: Dict[str, Any], 
+# Matches the first integer following a colon, e.g. "VRAM (Total): 8192 MB"
+_VRAM_RE = re.compile(r":\s*(\d+)")
+
+def detect_gpu(resources: Dict[str, Any],
                build_config: Dict[str, Any]) -> None:
     """Detect GPU hardware and update resources dictionary.
-    
+
     Args:
         resources: Resources dictionary to update
         build_config: Build configuration dictionary
@@ -23,14 +28,14 @@ def detect_gpu(resources: Dict[str, Any],
                 resources["gpu_detected"] = True
                 resources["gpu_vendor"] = "nvidia"
                 result = run_command([
-                    "nvidia-smi", "--query-gpu=memory.total", 
+                    "nvidia-smi", "--query-gpu=memory.total",
                     "--format=csv,noheader"
                 ])
                 if result:
                     resources["gpu_memory_mb"] = int(result.split()[0])
                 setup_gpu_env(build_config)
-        except:
-            pass
+        except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+            logger.debug("NVIDIA GPU query failed", exc_info=True)
     elif has_command("rocm-smi"):
         try:
             result = run_command(["rocm-smi", "--showmeminfo", "vram"])
@@ -39,13 +44,11 @@ def detect_gpu(resources: Dict[str, Any],
                 resources["gpu_vendor"] = "amd"
                 for line in result.split("\n"):
                     if "GPU memory" in line:
-                        try:
-                            memory_mb = int(line.split(":")[1].strip().split()[0])
-                            resources["gpu_memory_mb"] = memory_mb
-                        except:
-                            pass
-        except:
-            pass
+                        match = _VRAM_RE.search(line)
+                        if match:
+                            resources["gpu_memory_mb"] = int(match.group(1))
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            logger.debug("ROCm GPU query failed", exc_info=True)
     elif platform.system().lower() == "darwin" and has_command("system_profiler"):
         try:
             result = run_command(["system_profiler", "SPDisplaysDataType"])
@@ -54,17 +57,15 @@ def detect_gpu(resources: Dict[str, Any],
                 resources["gpu_vendor"] = "apple"
                 for line in result.split("\n"):
                     if "VRAM" in line:
-                        try:
-                            memory_mb = int(line.split(":")[1].strip().split()[0])
-                            resources["gpu_memory_mb"] = memory_mb
-                        except:
-                            pass
-        except:
-            pass
+                        match = _VRAM_RE.search(line)
+                        if match:
+                            resources["gpu_memory_mb"] = int(match.group(1))
+        except (OSError, subprocess.CalledProcessError, ValueError):
+            logger.debug("Apple GPU query failed", exc_info=True)
 
 def setup_gpu_env(build_config: Dict[str, Any]) -> None:
     """Configure environment variables for GPU support.
-    
+
     Args:
         build_config: Build configuration dictionary
     """
@@ -73,11 +74,11 @@ def setup_gpu_env(build_config: Dict[str, Any]) -> None:
         os.environ["PATH"] = f"{cuda_home}/bin:{os.environ['PATH']}"
         ld_path = os.environ.get("LD_LIBRARY_PATH", "")
         os.environ["LD_LIBRARY_PATH"] = f"{cuda_home}/lib64:{ld_path}"
-        
+
     gpu_cache = build_config.get("paths", {}).get("gpu_cache")
     if gpu_cache:
         os.makedirs(gpu_cache, exist_ok=True)
         os.environ["CUDA_CACHE_PATH"] = gpu_cache
         os.environ["CUDA_CACHE_MAXSIZE"] = str(
             build_config.get("cuda", {}).get("cache_maxsize", "2147483648")
-        )
\ No newline at end of file
+        )
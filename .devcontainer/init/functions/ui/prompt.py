@@ -53,6 +53,22 @@ def blue(text: str) -> str:
     """
     return color_text(text, "\033[36m")
 
+def mask_secret(value: str) -> str:
+    """Mask a secret value, keeping at most a four character prefix.
+
+    Args:
+        value: Secret value to mask
+
+    Returns:
+        Masked value (e.g. "ghp_************"), or "****" if too short
+    """
+    # Branchless: short values keep a zero-length prefix, so the slice
+    # assignment leaves them fully masked at a minimum width of four
+    prefix_len = 4 * (len(value) > 4)
+    masked = ['*'] * max(len(value), 4)
+    masked[:prefix_len] = value[:prefix_len]
+    return ''.join(masked)
+
 def display_env_prompt(env_path: Path) -> bool:
     """Display environment variables and prompt for action.
     
@@ -73,19 +89,18 @@ def display_env_prompt(env_path: Path) -> bool:
     print("\nPlease review the environment settings below:\n")
     
     with open(env_path, 'r') as f:
-        lines = f.readlines()
-        
-    for line in lines:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            try:
-                key, value = line.split('=', 1)
-                # Mask security tokens
-                if any(secret in key.upper() for secret in ['TOKEN', 'PAT', 'SECRET', 'KEY']):
-                    value = value[:4] + '*' * (len(value) - 4) if len(value) > 4 else '****'
-                print(f"  {yellow(key)}={value}")
-            except ValueError:
-                print(f"  {line}")
+        # Stream the file line by line instead of materializing it
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                try:
+                    key, value = line.split('=', 1)
+                    # Mask security tokens
+                    if any(secret in key.upper() for secret in ['TOKEN', 'PAT', 'SECRET', 'KEY']):
+                        value = mask_secret(value)
+                    print(f"  {yellow(key)}={value}")
+                except ValueError:
+                    print(f"  {line}")
         
     print("\nWould you like to:")
     print("  1. Continue with these settings")
@@ -1,12 +1,79 @@
 """Git operations utilities."""
 
 import os
+import shutil
+import asyncio
+from functools import lru_cache
 from pathlib import Path
+from typing import List
 from ...log.logger import get_logger
 from ...core.system.commands import run_command
 
 logger = get_logger()
 
+@lru_cache(maxsize=1)
+def git_executable() -> str:
+    """Absolute path to the git binary, resolved from PATH once.
+
+    Passing the resolved path to exec skips the kernel-side PATH walk
+    that execvp would otherwise repeat for every spawned git process.
+    """
+    return shutil.which("git") or "git"
+
+# uvloop is an optional accelerator; the stdlib event loop is the fallback
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+async def _fetch_repo(repo_path: str) -> int:
+    """Fetch origin for one repository without blocking the event loop.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        git exit code
+    """
+    proc = await asyncio.create_subprocess_exec(
+        git_executable(), "-C", repo_path, "fetch", "origin",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    return await proc.wait()
+
+def prefetch_repositories(repo_paths: List[str]) -> int:
+    """Fetch origin for several repositories concurrently.
+
+    Fetches are network-bound, so gathering them on one event loop
+    overlaps the transfers; later per-repository fetches then hit
+    already-updated remote refs.
+
+    Args:
+        repo_paths: Candidate repository paths (non-repos are skipped)
+
+    Returns:
+        Number of repositories fetched successfully
+    """
+    paths = [p for p in repo_paths if (Path(p) / ".git").is_dir()]
+    if not paths:
+        return 0
+
+    async def _gather() -> List[int]:
+        return list(await asyncio.gather(*(_fetch_repo(p) for p in paths)))
+
+    try:
+        if uvloop is not None:
+            runner = asyncio.Runner(loop_factory=uvloop.new_event_loop)
+            with runner:
+                codes = runner.run(_gather())
+        else:
+            codes = asyncio.run(_gather())
+    except Exception as e:
+        logger.warning(f"Concurrent prefetch failed: {e}")
+        return 0
+    return sum(1 for code in codes if code == 0)
+
 def setup_git_config() -> None:
     """Configure Git global settings for better repository management."""
     configs = [
@@ -20,7 +87,7 @@ def setup_git_config() -> None:
     ]
     
     for name, value in configs:
-        run_command(["git", "config", "--global", name, value])
+        run_command([git_executable(), "config", "--global", name, value])
 
 def clone_or_update_repo(repo_path: str, repo_url: str) -> str:
     """Clone or update a Git repository.
@@ -32,9 +99,10 @@ def clone_or_update_repo(repo_path: str, repo_url: str) -> str:
     Returns:
         Repository name
     """
-    repo_name = Path(repo_path).name
-    
-    if Path(repo_path).joinpath(".git").is_dir():
+    repo_dir = Path(repo_path)
+    repo_name = repo_dir.name
+
+    if (repo_dir / ".git").is_dir():
         # Update existing repository
         run_command([
             "git", "-C", repo_path, "fetch", "--all", "--prune", "--jobs=4"
@@ -53,10 +121,15 @@ def clone_or_update_repo(repo_path: str, repo_url: str) -> str:
             "--recursive", "--jobs=4"
         ])
     else:
-        # Clone new repository
-        run_command([
-            "git", "clone", "--recursive", "--jobs=4", repo_url, repo_path
-        ])
+        # Clone new repository as a blobless partial clone: history and
+        # trees come down immediately, file contents are fetched on
+        # demand, which cuts first-clone transfer on large repositories
+        clone_args = [
+            "git", "clone", "--filter=blob:none", "--recursive", "--jobs=4"
+        ]
+        if os.environ.get("GIT_SHALLOW_CLONE", "").lower() in ("1", "true", "yes"):
+            clone_args += ["--depth=1", "--shallow-submodules"]
+        run_command(clone_args + [repo_url, repo_path])
     
     setup_lfs(repo_path)
     logger.info(f"✓ {repo_name} ready")
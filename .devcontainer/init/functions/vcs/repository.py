@@ -76,7 +76,7 @@ def process_local_repos() -> List[str]:
             repo_url = f"https://{github_token}@github.com/{github_username}/{repo}.git"
             repos_config[repo_name] = repo_url
             
-        # Process repositories sequentially with user interaction
+        # Process repositories sequentially; clone_or_update_repo never prompts
         processed_repos = []
         for repo_name, repo_url in repos_config.items():
             try:
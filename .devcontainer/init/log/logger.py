@@ -1,5 +1,7 @@
 import logging
+from functools import lru_cache
 from .formatter import ColorFormatter
+@lru_cache(maxsize=None)
 def get_logger(name: str = "devcontainer_init") -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.handlers:
@@ -16,9 +16,11 @@ Options:
 import os
 import sys
 import time
+import argparse
 import importlib
 import pkgutil
 import compileall
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Set, Dict, Any, List, Optional, Tuple, Callable
 
@@ -32,9 +34,9 @@ def measure_time(func: Callable) -> Callable:
         Wrapped function that reports execution time
     """
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         print(f"{func.__name__} completed in {duration:.2f} seconds")
         return result
@@ -49,24 +51,21 @@ def find_python_modules(start_dir: Path) -> List[Path]:
     Returns:
         List of paths to Python modules and packages
     """
-    python_files = []
-    
-    for root, dirs, files in os.walk(start_dir):
-        # Skip __pycache__ directories
-        if '__pycache__' in dirs:
-            dirs.remove('__pycache__')
-        
-        # Skip hidden directories (starting with .)
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(Path(root) / file)
-                
-        # Add directories with __init__.py as package directories
-        if '__init__.py' in files:
-            python_files.append(Path(root))
-            
+    def _wanted(path: Path) -> bool:
+        # Skip __pycache__ and hidden directories (starting with .)
+        return ('__pycache__' not in path.parts
+                and not any(part.startswith('.') for part in path.parts))
+
+    # rglob walks with os.scandir, so each directory costs a single syscall
+    # instead of the extra stat calls a manual os.walk pass incurs.
+    python_files = [p for p in start_dir.rglob('*.py') if _wanted(p.relative_to(start_dir))]
+
+    # Add directories with __init__.py as package directories
+    python_files.extend(
+        p.parent for p in start_dir.rglob('__init__.py')
+        if _wanted(p.relative_to(start_dir))
+    )
+
     return python_files
 
 @measure_time
@@ -115,62 +114,89 @@ def compile_bytecode(directory: Path, force: bool = True, quiet: bool = False) -
         print("Bytecode compilation encountered errors")
         return False
 
+def _import_module_tree(module_name: str, verbose: bool = False) -> Tuple[int, int]:
+    """Import a module and its immediate submodules.
+
+    Args:
+        module_name: Fully qualified module name to import
+        verbose: Whether to print details for each module
+
+    Returns:
+        Tuple of (successful imports, failed imports)
+    """
+    loaded = 0
+    failed = 0
+
+    try:
+        if verbose:
+            print(f"  Loading {module_name}...")
+
+        # Skip if already loaded
+        if module_name in sys.modules:
+            if verbose:
+                print(f"  ✓ {module_name} already loaded")
+            return 1, 0
+
+        # Import the module
+        module = importlib.import_module(module_name)
+        loaded += 1
+
+        if verbose:
+            print(f"  ✓ Successfully loaded {module_name}")
+
+        # Try to import submodules if it's a package
+        if hasattr(module, '__path__'):
+            for _, name, ispkg in pkgutil.iter_modules(module.__path__, module.__name__ + '.'):
+                try:
+                    if name not in sys.modules:
+                        importlib.import_module(name)
+                        loaded += 1
+                        if verbose:
+                            print(f"  ✓ Loaded submodule {name}")
+                except ImportError as e:
+                    failed += 1
+                    if verbose:
+                        print(f"  ✗ Failed to load submodule {name}: {e}")
+    except ImportError as e:
+        failed += 1
+        if verbose:
+            print(f"  ✗ Failed to load {module_name}: {e}")
+
+    return loaded, failed
+
 @measure_time
 def preload_modules(modules_to_load: List[str], verbose: bool = False) -> Tuple[int, int]:
     """Eagerly import modules to ensure they're loaded into memory.
-    
+
+    Imports run on a small thread pool: module imports are dominated by
+    stat calls and bytecode reads, so the file I/O overlaps across threads
+    while the import lock serializes only the final module initialization.
+
     Args:
         modules_to_load: List of modules to import
         verbose: Whether to print details for each module
-        
+
     Returns:
         Tuple of (successful imports, failed imports)
     """
     print(f"Preloading {len(modules_to_load)} modules...")
-    
+
+    if not modules_to_load:
+        return 0, 0
+
     loaded = 0
     failed = 0
-    loaded_modules = {}
-    
-    for module_name in modules_to_load:
-        try:
-            if verbose:
-                print(f"  Loading {module_name}...")
-                
-            # Skip if already loaded
-            if module_name in sys.modules:
-                if verbose:
-                    print(f"  ✓ {module_name} already loaded")
-                loaded += 1
-                continue
-                
-            # Import the module
-            module = importlib.import_module(module_name)
-            loaded_modules[module_name] = module
-            loaded += 1
-            
-            if verbose:
-                print(f"  ✓ Successfully loaded {module_name}")
-                
-            # Try to import submodules if it's a package
-            if hasattr(module, '__path__'):
-                for _, name, ispkg in pkgutil.iter_modules(module.__path__, module.__name__ + '.'):
-                    try:
-                        if name not in sys.modules:
-                            sub_module = importlib.import_module(name)
-                            loaded_modules[name] = sub_module
-                            loaded += 1
-                            if verbose:
-                                print(f"  ✓ Loaded submodule {name}")
-                    except ImportError as e:
-                        failed += 1
-                        if verbose:
-                            print(f"  ✗ Failed to load submodule {name}: {e}")
-        except ImportError as e:
-            failed += 1
-            if verbose:
-                print(f"  ✗ Failed to load {module_name}: {e}")
-                
+
+    with ThreadPoolExecutor(max_workers=min(8, len(modules_to_load))) as executor:
+        futures = [
+            executor.submit(_import_module_tree, name, verbose)
+            for name in modules_to_load
+        ]
+        for future in as_completed(futures):
+            tree_loaded, tree_failed = future.result()
+            loaded += tree_loaded
+            failed += tree_failed
+
     return loaded, failed
 
 @measure_time
@@ -193,21 +219,22 @@ def run_benchmark() -> Dict[str, float]:
     
     results = {}
     
-    # Clear modules from sys.modules to ensure fresh imports
-    for module in modules:
-        if module in sys.modules:
-            del sys.modules[module]
-            # Also remove submodules
-            for name in list(sys.modules.keys()):
-                if name.startswith(module + '.'):
-                    del sys.modules[name]
+    # Clear modules from sys.modules to ensure fresh imports; a single scan
+    # over sys.modules finds every module and submodule to invalidate
+    prefixes = tuple(module + '.' for module in modules)
+    stale = [
+        name for name in sys.modules
+        if name in modules or name.startswith(prefixes)
+    ]
+    for name in stale:
+        del sys.modules[name]
     
     # Benchmark each module import
     for module in modules:
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             importlib.import_module(module)
-            end_time = time.time()
+            end_time = time.perf_counter()
             duration = end_time - start_time
             results[module] = duration
             print(f"  {module}: {duration:.4f} seconds")
@@ -217,22 +244,42 @@ def run_benchmark() -> Dict[str, float]:
     
     return results
 
-def optimize_all() -> int:
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser for the optimization utility.
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        prog='optimize',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--quiet', action='store_true',
+                        help='Minimize output')
+    parser.add_argument('--force', action='store_true',
+                        help='Force recompilation even if bytecode is up to date')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Show detailed information about each module')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Run performance benchmarks after optimization')
+    return parser
+
+def optimize_all(argv: Optional[List[str]] = None) -> int:
     """Run full optimization process.
-    
+
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    # Parse command line arguments
-    force = '--force' in sys.argv
-    quiet = '--quiet' in sys.argv
-    verbose = '--verbose' in sys.argv
-    benchmark = '--benchmark' in sys.argv
-    
-    if '--help' in sys.argv or '-h' in sys.argv:
-        print(__doc__)
-        return 0
-    
+    args = build_parser().parse_args(argv)
+    force = args.force
+    quiet = args.quiet
+    verbose = args.verbose
+    benchmark = args.benchmark
+
     print("\n" + "="*80)
     print(" PYTHON-SLIM OPTIMIZATION UTILITY ".center(80, "="))
     print("="*80 + "\n")
@@ -242,8 +289,10 @@ def optimize_all() -> int:
         script_path = Path(__file__)
         init_dir = script_path.parent
         
-        # Ensure we're in the right directory
-        if not (init_dir / 'core').exists() or not (init_dir / 'functions').exists():
+        # Ensure we're in the right directory; one scandir covers all
+        # the expected entries instead of a stat per path
+        entries = {entry.name for entry in os.scandir(init_dir)}
+        if not {'core', 'functions'} <= entries:
             print(f"Error: Not running from the correct directory.")
             print(f"Expected to find core and functions subdirectories in {init_dir}")
             return 1
@@ -252,6 +301,14 @@ def optimize_all() -> int:
         bytecode_success = compile_bytecode(init_dir, force=force, quiet=quiet)
         if not bytecode_success and not force:
             print("Warning: Bytecode compilation had issues. Continuing anyway...")
+
+        # Also precompile the project-level helper packages so their first
+        # invocation skips the parse step too
+        project_root = init_dir.parent.parent
+        for extra in ('scripts', 'slimdev'):
+            extra_dir = project_root / extra
+            if extra_dir.is_dir():
+                compile_bytecode(extra_dir, force=force, quiet=quiet)
         
         # Step 2: Preload core modules
         core_modules = [
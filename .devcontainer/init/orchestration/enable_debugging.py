@@ -1,27 +1,29 @@
 import debugpy
-import time
+import threading
 import sys
 import os
 
 def main():
     """Enable remote debugging for processes in the container."""
     print("Enabling remote debugging on port 5678...")
-    debugpy.listen(("0.0.0.0", 5678))
+    # Run the debug adapter in-process instead of spawning a separate
+    # adapter subprocess per connection
+    debugpy.listen(("0.0.0.0", 5678), in_process_debug_adapter=True)
     print("Debug server is running on port 5678")
     print("Waiting for debugger to attach...")
-    
+
     if "--wait-for-client" in sys.argv:
         debugpy.wait_for_client()
         print("Debugger attached!")
-    
+
     print(f"Current environment: {os.environ.get('WORKSPACE_FOLDER', 'workspace')}/{os.environ.get('PROJECT_NAME', 'python-slim')}")
-    
-    # Keep debug server running
+
+    # Keep debug server running; blocking on an event avoids the
+    # once-per-second wakeup of a sleep loop
     try:
-        while True:
-            time.sleep(1)
+        threading.Event().wait()
     except KeyboardInterrupt:
         print("Debug server stopped")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,18 +2,14 @@
 
 import os
 import sys
-import atexit
+import shutil
 from pathlib import Path
 from typing import List, Tuple
 from ..log.logger import get_logger
-from ..core.system.commands import has_command
-from ..core.utils.validation import validate_executable
 from ..functions.vcs.git import setup_git_config
 from ..functions.vcs.repository import process_solution_repo, process_local_repos
-from ..functions.concurrency.executor import shutdown_executors
 
 logger = get_logger()
-atexit.register(shutdown_executors)
 
 def verify_git_installed() -> Tuple[bool, List[str]]:
     """Verify that required Git tools are installed.
@@ -21,10 +17,12 @@ def verify_git_installed() -> Tuple[bool, List[str]]:
     Returns:
         Tuple of (all_tools_installed, list_of_missing_tools)
     """
+    # shutil.which stops at the first PATH hit instead of probing every
+    # directory the way validate_executable does
     missing = []
-    if not validate_executable("git"):
+    if shutil.which("git") is None:
         missing.append("git")
-    if not validate_executable("git-lfs"):
+    if shutil.which("git-lfs") is None:
         logger.warning("git-lfs not found, large files may not be handled properly")
     return len(missing) == 0, missing
 
@@ -2,7 +2,8 @@
 
 import os
 import sys
-import atexit
+import stat
+from functools import lru_cache
 from typing import Dict, Any, Set, Optional
 from ..log.logger import get_logger
 from ..core.config.loader import load_config
@@ -12,19 +13,34 @@ from ..core.utils.validation import validate_dict_key
 from ..functions.resource.detection import detect_resources
 from ..functions.optimization.compiler import setup_ccache, apply_compiler_flags
 from ..functions.optimization.binary import compile_python_bytecode, strip_binaries
-from ..functions.concurrency.executor import shutdown_executors
 
 logger = get_logger()
-atexit.register(shutdown_executors)
+
+# Hardware detection probes /proc and spawns vendor tools; the results
+# cannot change within a container's lifetime, so compute them once
+
+@lru_cache(maxsize=None)
+def _cached_config(config_name: str) -> Dict[str, Any]:
+    """Load a config section once per process; config.yaml is static
+    for the lifetime of the container."""
+    return load_config(config_name) or {}
+
+@lru_cache(maxsize=1)
+def _cached_cpu_features() -> Set[str]:
+    return detect_cpu_features()
+
+@lru_cache(maxsize=1)
+def _cached_resources() -> Dict[str, Any]:
+    return detect_resources(_cached_config("build"))
 
 class PythonOptimizer:
     """Optimizes Python interpreter based on system capabilities."""
-    
+
     def __init__(self):
-        self.build_config = load_config("build") or {}
-        self.python_config = load_config("python") or {}
-        self.resources = detect_resources(self.build_config)
-        self.cpu_features = detect_cpu_features()
+        self.build_config = _cached_config("build")
+        self.python_config = _cached_config("python")
+        self.resources = _cached_resources()
+        self.cpu_features = _cached_cpu_features()
     
     def validate_configs(self) -> bool:
         """Validate that necessary configuration is available.
@@ -45,15 +61,29 @@ class PythonOptimizer:
             True if optimization was successful, False otherwise
         """
         python_exec = os.environ.get("PYTHON_EXEC", sys.executable)
-        if not os.path.isfile(python_exec) or not os.access(python_exec, os.X_OK):
+        # One stat answers both questions the isfile + access pair asked
+        try:
+            mode = os.stat(python_exec).st_mode
+            exec_valid = stat.S_ISREG(mode) and bool(
+                mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            )
+        except OSError:
+            exec_valid = False
+        if not exec_valid:
             logger.error(f"Python executable not valid at {python_exec}. Falling back to sys.executable.")
             python_exec = sys.executable  # fallback to current interpreter
         try:
             logger.info(f"Optimizing Python at {python_exec}")
+            py_env = validate_dict_key(self.python_config, "environment", {})
+            # Redirect bytecode caches to a dedicated prefix so container
+            # mounts stay clean, and validate cached .pyc files by source
+            # hash: bind-mounted sources make timestamps unreliable
+            pycache_prefix = validate_dict_key(py_env, "pycache_prefix", "/tmp/pycache")
+            if pycache_prefix:
+                os.environ["PYTHONPYCACHEPREFIX"] = str(pycache_prefix)
             apply_compiler_flags(self.build_config, self.cpu_features)
-            compile_python_bytecode(python_exec)
+            compile_python_bytecode(python_exec, invalidation_mode="checked-hash")
             strip_binaries(python_exec)
-            py_env = validate_dict_key(self.python_config, "environment", {})
             os.environ["PYTHONHASHSEED"] = str(validate_dict_key(py_env, "hashseed", "1"))
             os.environ["PYTHONDONTWRITEBYTECODE"] = str(
                 validate_dict_key(py_env, "dont_write_bytecode", "1")
@@ -1,12 +1,13 @@
 """Repository management functionality."""
 
 import os
-import traceback
+import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from ..log.logger import get_logger
 from ..core.system.commands import run_command
-from ..functions.vcs.git import clone_or_update_repo
+from ..functions.vcs.git import clone_or_update_repo, prefetch_repositories
+from ..functions.concurrency.executor import parallel_map
 from ..functions.ui.prompt import blue, green, yellow
 
 logger = get_logger()
@@ -22,23 +23,56 @@ def check_repository_status(repo_path: Path) -> Tuple[bool, bool, bool]:
     """
     if not repo_path.exists() or not (repo_path / ".git").exists():
         return False, False, False
-    
-    # Check for local changes
-    result = run_command(["git", "-C", str(repo_path), "status", "--porcelain"])
-    has_changes = bool(result and result.strip())
-    
-    # Check for remote changes
+
+    # Refresh remote refs, then read local and remote state from a single
+    # porcelain-v2 status instead of separate status + rev-list calls
     run_command(["git", "-C", str(repo_path), "fetch", "origin"], check=False)
     result = run_command([
-        "git", "-C", str(repo_path), "rev-list", "HEAD..@{upstream}", "--count"
+        "git", "-C", str(repo_path), "status", "--porcelain=v2", "--branch"
     ], check=False)
-    
-    # Ensure result is a boolean
-    has_remote_changes = bool(result and result.strip() and result.strip() != "0")
-    
+
+    has_changes = False
+    has_remote_changes = False
+    for line in (result or "").splitlines():
+        if line.startswith("# branch.ab "):
+            # Header format is "# branch.ab +<ahead> -<behind>"
+            behind = line.rsplit("-", 1)[-1]
+            has_remote_changes = behind.isdigit() and int(behind) > 0
+        elif not line.startswith("#"):
+            # Headers always precede entries, so any remaining line
+            # indicates a local change
+            has_changes = True
+            break
+
     return True, has_changes, has_remote_changes
 
-def manage_repository(repo_name: str, repo_url: str, repo_path: Path, 
+def _pull_updates(repo_name: str, repo_path: Path) -> None:
+    """Pull remote updates while keeping local changes.
+
+    Args:
+        repo_name: Name of the repository
+        repo_path: Local path for the repository
+    """
+    logger.info(f"Pulling updates for {repo_name} (keeping local changes)")
+    run_command(["git", "-C", str(repo_path), "pull", "--rebase=false"])
+
+def _reset_to_remote(repo_name: str, repo_path: Path) -> None:
+    """Discard local changes and reset the repository to its remote state.
+
+    Args:
+        repo_name: Name of the repository
+        repo_path: Local path for the repository
+    """
+    logger.info(f"Resetting {repo_name} to remote state")
+    run_command(["git", "-C", str(repo_path), "fetch", "origin"])
+    branch = run_command([
+        "git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"
+    ])
+    run_command([
+        "git", "-C", str(repo_path), "reset", "--hard", f"origin/{branch}"
+    ])
+
+def manage_repository(repo_name: str, repo_url: str, repo_path: Path,
                       force: bool = False, dry_run: bool = False) -> str:
     """Manage a repository - clone, update, or handle conflicts.
     
@@ -64,40 +98,34 @@ def manage_repository(repo_name: str, repo_url: str, repo_path: Path,
     
     if has_changes:
         if force or dry_run:
-            action = "2"  # Force reset to remote state in force mode or simulate in dry run
             if dry_run:
                 logger.info(f"[DRY RUN] Would reset {repo_name} to remote state (discard local changes)")
                 return repo_name
-            logger.info(f"Force mode enabled: resetting {repo_name} to remote state")
-            run_command(["git", "-C", str(repo_path), "fetch", "origin"])
-            branch = run_command([
-                "git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"
-            ])
-            run_command([
-                "git", "-C", str(repo_path), "reset", "--hard", f"origin/{branch}"
-            ])
+            logger.info(f"Force mode enabled for {repo_name}")
+            _reset_to_remote(repo_name, repo_path)
+        elif not sys.stdin.isatty():
+            # Headless provisioning has no one to answer a prompt; skip
+            # the whole interactive path and leave the repository as-is
+            logger.info(
+                f"Non-interactive session: leaving {repo_name} unchanged "
+                f"(local changes present)"
+            )
         else:
             print(f"{yellow('Local changes detected!')} What would you like to do?")
             print("  1. Keep changes and pull updates (may cause conflicts)")
             print("  2. Reset to remote state (will discard all local changes)")
             print("  3. Skip updating this repository")
+
+            # Dispatch table replaces the if/elif chain over choices
+            actions = {
+                '1': _pull_updates,
+                '2': _reset_to_remote,
+                '3': lambda name, path: None,  # Skip updating
+            }
             choice = None
-            while choice not in ['1', '2', '3']:
+            while choice not in actions:
                 choice = input(f"\n{green('Enter your choice (1-3)')} [3]: ") or '3'
-            
-            if choice == '1':
-                logger.info(f"Pulling updates for {repo_name} (keeping local changes)")
-                run_command(["git", "-C", str(repo_path), "pull", "--rebase=false"])
-            elif choice == '2':
-                logger.info(f"Resetting {repo_name} to remote state")
-                run_command(["git", "-C", str(repo_path), "fetch", "origin"])
-                branch = run_command([
-                    "git", "-C", str(repo_path), "rev-parse", "--abbrev-ref", "HEAD"
-                ])
-                run_command([
-                    "git", "-C", str(repo_path), "reset", "--hard", f"origin/{branch}"
-                ])
-            # Else, skip updating
+            actions[choice](repo_name, repo_path)
     else:
         if has_remote_changes:
             logger.info(f"Pulling updates for {repo_name}")
@@ -120,6 +148,29 @@ def manage_repositories(root_path: Path, repos_config: Dict[str, str],
     Returns:
         List of successfully managed repository names
     """
+    if repos_config and (force or dry_run):
+        # Non-interactive modes never prompt, so repositories can be
+        # managed concurrently; the git calls are network-bound and
+        # overlap well on a small bounded pool
+        def _manage(item: Tuple[str, str]) -> str:
+            repo_name, repo_url = item
+            return manage_repository(
+                repo_name, repo_url, root_path / repo_name,
+                force=force, dry_run=dry_run
+            )
+
+        results = parallel_map(
+            _manage, repos_config.items(),
+            executor_name="repositories",
+            workers=min(4, len(repos_config))
+        )
+        return [name for name in results if name]
+
+    # Warm the remote refs for every existing repository up front; the
+    # per-repository fetches in the interactive loop below then return
+    # without network traffic
+    prefetch_repositories([str(root_path / name) for name in repos_config])
+
     managed_repos = []
     for repo_name, repo_url in repos_config.items():
         repo_path = root_path / repo_name
@@ -127,8 +178,9 @@ def manage_repositories(root_path: Path, repos_config: Dict[str, str],
             result = manage_repository(repo_name, repo_url, repo_path, force=force, dry_run=dry_run)
             if result:
                 managed_repos.append(result)
-        except Exception as e:
-            logger.error(f"Error managing repository {repo_name}: {e}")
-            logger.debug(traceback.format_exc())
+        except Exception:
+            # logger.exception formats the traceback lazily, only when the
+            # record is actually emitted
+            logger.exception(f"Error managing repository {repo_name}")
     
     return managed_repos
\ No newline at end of file
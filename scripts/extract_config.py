@@ -1,32 +1,48 @@
 #!/usr/bin/env python3
 """Extract container configuration from pyproject.toml."""
 
+import os
 import tomli
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=4)
+def _load_pyproject(path: str, mtime_ns: int) -> dict:
+    """Parse a pyproject.toml, memoized on path and modification time.
+
+    Repeated invocations against an unchanged file (e.g. one call per
+    variable from shell orchestration) reuse the parsed result instead
+    of re-reading the TOML.
+    """
+    with open(path, "rb") as f:
+        return tomli.load(f)
+
+
 def main():
     """Extract configuration and output as environment variables."""
     pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-    
-    with open(pyproject_path, "rb") as f:
-        pyproject = tomli.load(f)
-    
+
+    pyproject = _load_pyproject(
+        str(pyproject_path), os.stat(pyproject_path).st_mtime_ns
+    )
+
     # Changed from container to slimdev to match actual config section
     container_config = pyproject.get("tool", {}).get("slimdev", {})
-    
+
     if not container_config:
         print("Error: No tool.slimdev section found in pyproject.toml", file=sys.stderr)
         sys.exit(1)
-    
-    # Output as environment variables
-    for key, value in container_config.items():
-        key = key.upper()
-        if isinstance(value, bool):
-            value = str(value).lower()
-        print(f"{key}={value}")
+
+    # Output as environment variables in one buffered write rather than
+    # a print (and potential flush) per key
+    lines = [
+        f"{key.upper()}={str(value).lower() if isinstance(value, bool) else value}"
+        for key, value in container_config.items()
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,15 +4,58 @@ Configuration management for slimdev.
 Provides a central configuration interface that extracts settings from pyproject.toml.
 """
 
+import os
 import sys
-import tomli
+import mmap
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Header written to every generated .env file
+ENV_FILE_HEADER = "# Generated from pyproject.toml - DO NOT EDIT\n"
+
+# Per-type value formatters for environment variables; anything not
+# listed falls back to str(). Booleans render lowercase (true/false).
+_ENV_FORMATTERS = {
+    bool: lambda value: str(value).lower(),
+}
+
+# Files at or above this size are read through mmap instead of buffered I/O
+_MMAP_THRESHOLD = 1 << 20
+
+
+@lru_cache(maxsize=4)
+def _parse_pyproject(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a pyproject.toml, memoized on path and modification time.
+
+    Every Config() re-reads the same file; keying the cache on
+    st_mtime_ns shares one parse across instances while still picking
+    up edits.
+    """
+    # Deferred so importing this module for Config's interface alone
+    # never pays for the TOML parser; cached in sys.modules afterwards
+    try:
+        import tomllib  # Python 3.11+: stdlib parser
+    except ImportError:
+        import tomli as tomllib
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            # Unusually large files: let the kernel page the bytes in
+            # rather than copying them through the read buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return tomllib.loads(mm[:].decode("utf-8"))
+        return tomllib.load(f)
 
 
 class Config:
     """Configuration manager for the slim development container."""
 
+    # Fixed attribute set: lookups go through slot descriptors instead
+    # of a per-instance __dict__, and each instance is smaller
+    __slots__ = ("toml_path", "_config", "_env_keys", "_env_vars")
+
     def __init__(self, toml_path: Optional[Path] = None) -> None:
         """
         Initialize the configuration.
@@ -25,17 +68,42 @@ class Config:
         
         self.toml_path = toml_path
         self._config = self._load_config()
+        # Environment variable names derive mechanically from the config
+        # keys; uppercase them once at load rather than on every lookup
+        self._env_keys = {key: key.upper() for key in self._config}
+        self._env_vars: Optional[Mapping[str, str]] = None
     
     def _find_pyproject(self) -> Path:
         """Find pyproject.toml by looking in parent directories."""
+        # An explicit override skips the walk entirely; useful when the
+        # caller's working directory is unrelated to the project
+        override = os.environ.get("PYPROJECT_PATH")
+        if override:
+            override_path = Path(override)
+            try:
+                os.stat(override_path)
+            except OSError:
+                pass
+            else:
+                return override_path
+
         current_dir = Path.cwd()
-        
-        while current_dir != current_dir.parent:
+
+        while True:
             pyproject = current_dir / "pyproject.toml"
-            if pyproject.exists():
+            # One stat per level; a missing file is the common case on
+            # the way up, so probe with try/except rather than exists()
+            try:
+                os.stat(pyproject)
+            except OSError:
+                pass
+            else:
                 return pyproject
-            current_dir = current_dir.parent
-        
+            parent = current_dir.parent
+            if parent == current_dir:
+                break
+            current_dir = parent
+
         raise FileNotFoundError(
             "Could not find pyproject.toml in any parent directory. "
             "Please ensure you're running this from within a Python project."
@@ -44,8 +112,9 @@ class Config:
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from pyproject.toml."""
         try:
-            with open(self.toml_path, "rb") as f:
-                pyproject = tomli.load(f)
+            pyproject = _parse_pyproject(
+                str(self.toml_path), os.stat(self.toml_path).st_mtime_ns
+            )
         except Exception as e:
             raise ValueError(f"Failed to parse pyproject.toml: {str(e)}")
         
@@ -60,27 +129,25 @@ class Config:
         
         return config
     
-    def get_env_vars(self) -> Dict[str, str]:
+    def get_env_vars(self) -> Mapping[str, str]:
         """
         Get configuration as environment variables.
-        
+
+        The mapping is computed once per instance and returned as a
+        read-only view, so repeated callers share one dict and cannot
+        mutate each other's copy.
+
         Returns:
-            Dict mapping environment variable names to values.
+            Read-only mapping of environment variable names to values.
         """
-        result = {}
-        
-        for key, value in self._config.items():
-            env_key = key.upper()
-            
-            # Convert booleans to lowercase strings
-            if isinstance(value, bool):
-                value = str(value).lower()
-            else:
-                value = str(value)
-            
-            result[env_key] = value
-        
-        return result
+        if self._env_vars is None:
+            env_keys = self._env_keys
+            self._env_vars = MappingProxyType({
+                env_keys[key]: _ENV_FORMATTERS.get(type(value), str)(value)
+                for key, value in self._config.items()
+            })
+
+        return self._env_vars
     
     def generate_env_file(self, path: Path) -> None:
         """
@@ -91,11 +158,16 @@ class Config:
         """
         env_vars = self.get_env_vars()
         
+        # Assemble the whole file in memory and hand it to one write;
+        # encoding once and writing binary skips the TextIOWrapper's
+        # per-write encode layer
+        content = "".join(
+            [ENV_FILE_HEADER] + [f"{key}={value}\n" for key, value in env_vars.items()]
+        ).encode("utf-8")
+
         try:
-            with open(path, "w") as f:
-                f.write("# Generated from pyproject.toml - DO NOT EDIT\n")
-                for key, value in env_vars.items():
-                    f.write(f"{key}={value}\n")
+            with open(path, "wb") as f:
+                f.write(content)
             print(f"Environment file generated at: {path}")
         except Exception as e:
             raise IOError(f"Failed to write environment file to {path}: {str(e)}")
@@ -127,14 +199,15 @@ def generate_env() -> None:
     """
     config = Config()
     
-    # Ensure .devcontainer directory exists
+    # Ensure .devcontainer directory exists: one stat settles the common
+    # case (directory already present next to the project) and only the
+    # fallback location pays for a race-free makedirs
     devcontainer_dir = Path.cwd().parent / ".devcontainer"
-    if not devcontainer_dir.exists():
+    try:
+        os.stat(devcontainer_dir)
+    except OSError:
         devcontainer_dir = Path.cwd() / ".devcontainer"
-    
-    if not devcontainer_dir.exists():
-        devcontainer_dir.mkdir(parents=True)
-        print(f"Created .devcontainer directory at: {devcontainer_dir}")
+        os.makedirs(devcontainer_dir, exist_ok=True)
     
     env_file = devcontainer_dir / ".env"
     config.generate_env_file(env_file)
@@ -144,9 +217,12 @@ if __name__ == "__main__":
     """When executed directly, generate .env file and print variables."""
     try:
         config = Config()
-        
-        for key, value in config.get_env_vars().items():
-            print(f"{key}={value}")
+
+        # One buffered write for the whole block instead of a print per
+        # variable
+        sys.stdout.write(
+            "".join(f"{key}={value}\n" for key, value in config.get_env_vars().items())
+        )
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
\ No newline at end of file
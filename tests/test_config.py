@@ -7,39 +7,50 @@ import pytest
 from slimdev.config import Config
 
 
-def test_config_loading():
+@pytest.fixture(scope="module")
+def config():
+    """One Config shared by the whole module; loading is read-only."""
+    return Config()
+
+
+@pytest.mark.parametrize(
+    "accessor, expected",
+    [
+        (lambda c: isinstance(c["python_version"], str), True),
+        (lambda c: c.get("postgres_user"), "postgres"),
+        (lambda c: c.get("nonexistent_key", "default"), "default"),
+    ],
+)
+def test_config_loading(config, accessor, expected):
     """Test loading configuration from pyproject.toml."""
-    config = Config()
-    
-    # Test accessor methods
-    assert isinstance(config["python_version"], str)
-    assert config.get("postgres_user") == "postgres"
-    assert config.get("nonexistent_key", "default") == "default"
+    assert accessor(config) == expected
 
 
-def test_env_var_generation():
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("PYTHON_VERSION", None),
+        ("DEV_MODE", "true"),  # Boolean converted to lowercase string
+    ],
+)
+def test_env_var_generation(config, key, expected):
     """Test generation of environment variables."""
-    config = Config()
     env_vars = config.get_env_vars()
-    
-    assert "PYTHON_VERSION" in env_vars
-    assert "DEV_MODE" in env_vars
-    # Boolean should be converted to lowercase string
-    assert env_vars["DEV_MODE"] == "true"
 
+    assert key in env_vars
+    if expected is not None:
+        assert env_vars[key] == expected
 
-def test_env_file_generation():
+
+@pytest.mark.parametrize(
+    "fragment",
+    ["PYTHON_VERSION=", "POSTGRES_USER=postgres"],
+)
+def test_env_file_generation(config, fragment):
     """Test generating .env file."""
-    config = Config()
-    
     with tempfile.TemporaryDirectory() as temp_dir:
         env_path = Path(temp_dir) / ".env"
         config.generate_env_file(env_path)
-        
-        # Check file exists
+
         assert env_path.exists()
-        
-        # Read and verify content
-        content = env_path.read_text()
-        assert "PYTHON_VERSION=" in content
-        assert "POSTGRES_USER=postgres" in content
\ No newline at end of file
+        assert fragment in env_path.read_text()